@@ -1,33 +1,68 @@
 #!/usr/bin/env python3
 """Interactive release preparation script."""
 
+import functools
 import re
 import subprocess
 import sys
-import tempfile
-from datetime import datetime
+import tomllib
 from pathlib import Path
 
-import questionary
-import tomlkit
+# questionary and tempfile are imported inside the functions that use them,
+# so preflight failures exit before paying for prompt_toolkit's import time
 
 # Import business logic from faker_galactic package
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from faker_galactic import release_utils
 
+# The [project] table header, and the start of whatever table follows it
+_PROJECT_TABLE_RE = re.compile(r"^\[project\][^\S\n]*(?:#.*)?$", re.MULTILINE)
+_TABLE_HEADER_RE = re.compile(r"^\[", re.MULTILINE)
 
+# A version = "1.2.3" line; only searched within the [project] table
+_VERSION_RE = re.compile(r'^version = "([^"]+)"', re.MULTILINE)
+
+# Matches git@github.com:owner/repo.git or https://github.com/owner/repo.git
+# (the repo group keeps dots, so owner/faker.js.git -> faker.js)
+_REMOTE_RE = re.compile(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?/?$")
+
+# Start of the first "## [x.y.z] - date" entry in CHANGELOG.md
+_CHANGELOG_VERSION_RE = re.compile(r"^## \[", re.MULTILINE)
+
+# First blank line following a non-blank line (end of the changelog header)
+_CHANGELOG_HEADER_END_RE = re.compile(r"\S.*\n[^\S\n]*\n")
+
+# Fixed git invocations for the release lookups
+_LAST_TAG_CMD = ("git", "describe", "--tags", "--abbrev=0")
+# Explicit format rather than --oneline, which picks up ref names when the
+# user has log.decorate configured and breaks commit message parsing
+_LOG_CMD = ("git", "log", "--format=%h %s")
+_REMOTE_URL_CMD = ("git", "remote", "get-url", "origin")
+
+
+def _project_version(content: str) -> str | None:
+    """Return project.version from pyproject.toml text, or None if unusable."""
+    try:
+        project = tomllib.loads(content).get("project")
+    except tomllib.TOMLDecodeError:
+        return None
+    if not isinstance(project, dict):
+        return None
+    version = project.get("version")
+    return version if isinstance(version, str) else None
+
+
+@functools.lru_cache(maxsize=1)
 def get_current_version() -> str:
-    """Read current version from pyproject.toml."""
-    pyproject = Path("pyproject.toml")
-    content = pyproject.read_text()
-    match = re.search(r'^version = "([^"]+)"', content, re.MULTILINE)
-    if not match:
+    """Read current version from the [project] table of pyproject.toml."""
+    version = _project_version(Path("pyproject.toml").read_text())
+    if version is None:
         print("❌ Could not find version in pyproject.toml")
         sys.exit(1)
-    return match.group(1)
+    return version
 
 
-def calculate_versions(current: str) -> dict[str, str]:
+def calculate_versions(current: str) -> release_utils.Versions:
     """Calculate patch, minor, major versions from current."""
     try:
         return release_utils.calculate_versions(current)
@@ -38,6 +73,8 @@ def calculate_versions(current: str) -> dict[str, str]:
 
 def show_warning() -> bool:
     """Show warning and get confirmation."""
+    import questionary
+
     print("\n⚠️  You are about to create a public release PR.\n")
     print("This will:")
     print("  - Create a release branch")
@@ -49,37 +86,39 @@ def show_warning() -> bool:
     return confirm if confirm is not None else False
 
 
-def select_version(current: str, versions: dict[str, str]) -> str | None:
+def select_version(current: str, versions: release_utils.Versions) -> str | None:
     """Show version selection menu."""
+    import questionary
+
     print(f"\nCurrent version: {current}\n")
 
     choices = [
         questionary.Choice(
-            f"patch ({versions['patch']}) - Bug fixes, no new features",
-            value="patch",
+            f"patch ({versions.patch}) - Bug fixes, no new features",
+            value=versions.patch,
         ),
         questionary.Choice(
-            f"minor ({versions['minor']}) - New features, backwards compatible",
-            value="minor",
+            f"minor ({versions.minor}) - New features, backwards compatible",
+            value=versions.minor,
         ),
         questionary.Choice(
-            f"major ({versions['major']}) - Breaking changes", value="major"
+            f"major ({versions.major}) - Breaking changes", value=versions.major
         ),
     ]
 
-    bump_type = questionary.select("Select version bump:", choices=choices).ask()
-
-    if bump_type is None:
-        return None
-
-    return versions[bump_type]
+    # Each choice's value is the version itself; None means the user cancelled
+    new_version: str | None = questionary.select(
+        "Select version bump:", choices=choices
+    ).ask()
+    return new_version
 
 
+@functools.lru_cache(maxsize=1)
 def get_last_release_tag() -> str | None:
     """Get the last release tag, or None if no tags exist."""
     try:
         result = subprocess.run(
-            ["git", "describe", "--tags", "--abbrev=0"],
+            _LAST_TAG_CMD,
             capture_output=True,
             text=True,
             check=True,
@@ -91,32 +130,24 @@ def get_last_release_tag() -> str | None:
 
 def get_commits_since(tag: str | None) -> list[str]:
     """Get commit messages since tag (or all if tag is None)."""
-    if tag:
-        cmd = ["git", "log", f"{tag}..HEAD", "--oneline"]
-    else:
-        cmd = ["git", "log", "--oneline"]
-
+    cmd = (*_LOG_CMD, f"{tag}..HEAD") if tag else _LOG_CMD
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return result.stdout.strip().split("\n") if result.stdout.strip() else []
-
-
-def parse_commit_message(commit: str) -> tuple[str, str | None]:
-    """Parse commit into (message, pr_number)."""
-    return release_utils.parse_commit_message(commit)
+    output = result.stdout.strip()
+    return output.split("\n") if output else []
 
 
+@functools.lru_cache(maxsize=1)
 def get_repo_info() -> tuple[str, str]:
     """Get GitHub owner/repo from git remote."""
     result = subprocess.run(
-        ["git", "remote", "get-url", "origin"],
+        _REMOTE_URL_CMD,
         capture_output=True,
         text=True,
         check=True,
     )
     url = result.stdout.strip()
 
-    # Parse: git@github.com:owner/repo.git or https://github.com/owner/repo.git
-    match = re.search(r"github\.com[:/]([^/]+)/([^/\.]+)", url)
+    match = _REMOTE_RE.search(url)
     if not match:
         print("❌ Could not parse GitHub repo from remote URL")
         sys.exit(1)
@@ -124,14 +155,28 @@ def get_repo_info() -> tuple[str, str]:
     return match.group(1), match.group(2)
 
 
-def generate_changelog_entry(version: str, commits: list[str]) -> str:
+def invalidate_caches() -> None:
+    """Forget memoized version, tag and remote lookups.
+
+    Call after anything that may change them, e.g. pulling from origin.
+    """
+    get_current_version.cache_clear()
+    get_last_release_tag.cache_clear()
+    get_repo_info.cache_clear()
+
+
+def generate_changelog_entry(
+    version: str, commits: list[str], date: str | None = None
+) -> str:
     """Generate CHANGELOG entry from commits."""
     owner, repo = get_repo_info()
-    return release_utils.format_changelog_entry(version, commits, owner, repo)
+    return release_utils.format_changelog_entry(version, commits, owner, repo, date)
 
 
 def preview_changelog(entry: str) -> bool:
     """Show changelog entry and get confirmation."""
+    import questionary
+
     print("\n📝 Generated CHANGELOG entry:\n")
     print(entry)
     print()
@@ -142,30 +187,40 @@ def preview_changelog(entry: str) -> bool:
 
 
 def update_version_in_pyproject(new_version: str) -> None:
-    """Update version in pyproject.toml using tomlkit to preserve formatting."""
+    """Update version in pyproject.toml, leaving the rest of the file untouched."""
     pyproject = Path("pyproject.toml")
 
     try:
         content = pyproject.read_text()
-        doc = tomlkit.parse(content)
     except Exception as e:
-        print(f"❌ Failed to read/parse pyproject.toml: {e}")
+        print(f"❌ Failed to read pyproject.toml: {e}")
         sys.exit(1)
 
-    # Access project section (tomlkit returns Table objects, not dict)
-    project = doc.get("project")
-    if project is None:
-        print("❌ Could not find [project] section in pyproject.toml")
+    # Only the quoted value of the version line inside [project] is replaced;
+    # version keys in other tables (e.g. [tool.*]) are left alone
+    header = _PROJECT_TABLE_RE.search(content)
+    start = header.end() if header else len(content)
+    next_table = _TABLE_HEADER_RE.search(content, start)
+    end = next_table.start() if next_table else len(content)
+    table, count = _VERSION_RE.subn(
+        f'version = "{new_version}"', content[start:end], count=1
+    )
+    if count != 1:
+        print("❌ Could not find version in pyproject.toml")
         sys.exit(1)
 
-    project["version"] = new_version
+    new_content = content[:start] + table + content[end:]
+    if _project_version(new_content) != new_version:
+        print("❌ Failed to update [project] version in pyproject.toml")
+        sys.exit(1)
 
     try:
-        pyproject.write_text(tomlkit.dumps(doc))
+        pyproject.write_text(new_content)
     except Exception as e:
         print(f"❌ Failed to write pyproject.toml: {e}")
         sys.exit(1)
 
+    get_current_version.cache_clear()
     print(f"✓ Updated version in pyproject.toml to {new_version}")
 
 
@@ -183,33 +238,23 @@ def update_changelog(entry: str) -> None:
         print(f"❌ Failed to read CHANGELOG.md: {e}")
         sys.exit(1)
 
-    lines = content.split("\n")
-    insert_idx = 0
-    found_version = False
-
     # Find the first existing version entry
-    for i, line in enumerate(lines):
-        if line.startswith("## ["):
-            insert_idx = i
-            found_version = True
-            break
-
-    # If no existing versions, find end of header section
-    if not found_version:
-        # Skip past title and description to first blank line
-        for i, line in enumerate(lines):
-            if i > 0 and line.strip() == "" and lines[i - 1].strip() != "":
-                insert_idx = i + 1
-                break
-        else:
-            # No blank line found, append at end
-            insert_idx = len(lines)
+    match = _CHANGELOG_VERSION_RE.search(content)
+    if match:
+        insert_at: int | None = match.start()
+    else:
+        # If no existing versions, skip past title and description
+        match = _CHANGELOG_HEADER_END_RE.search(content)
+        insert_at = match.end() if match else None
 
-    # Insert new entry
-    new_lines = lines[:insert_idx] + [entry, ""] + lines[insert_idx:]
+    if insert_at is None:
+        # No blank line found, append at end
+        new_content = f"{content}\n{entry}\n"
+    else:
+        new_content = f"{content[:insert_at]}{entry}\n\n{content[insert_at:]}"
 
     try:
-        changelog.write_text("\n".join(new_lines))
+        changelog.write_text(new_content)
     except Exception as e:
         print(f"❌ Failed to write CHANGELOG.md: {e}")
         sys.exit(1)
@@ -230,37 +275,46 @@ def update_lock_file() -> None:
         sys.exit(1)
 
 
-def verify_on_master() -> None:
-    """Check current branch is master, exit if not."""
+def get_git_state() -> tuple[str, bool]:
+    """Get (current branch, has uncommitted changes) from a single git call."""
     try:
         result = subprocess.run(
-            ["git", "branch", "--show-current"],
+            [
+                "git",
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "--untracked-files=no",
+                "-z",
+            ],
             capture_output=True,
             text=True,
             check=True,
         )
-        current_branch = result.stdout.strip()
-        if current_branch != "master":
-            print(f"❌ Must be on master branch (currently on {current_branch})")
-            sys.exit(1)
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to get current branch: {e}")
+        print(f"❌ Failed to get working directory status: {e}")
         sys.exit(1)
 
+    # NUL-separated records: "# branch.*" headers first, then one per change
+    branch = ""
+    dirty = False
+    for record in result.stdout.split("\0"):
+        if record.startswith("# branch.head "):
+            branch = record.removeprefix("# branch.head ")
+        elif record and not record.startswith("#"):
+            dirty = True
+            break
+    return branch, dirty
 
-def verify_clean_working_dir() -> None:
-    """Check no uncommitted changes, exit if dirty."""
-    try:
-        result = subprocess.run(
-            ["git", "diff-index", "--quiet", "HEAD", "--"],
-            capture_output=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            print("❌ You have uncommitted changes. Commit or stash them first.")
-            sys.exit(1)
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to check working directory status: {e}")
+
+def verify_preflight() -> None:
+    """Check current branch is master with no uncommitted changes, exit if not."""
+    branch, dirty = get_git_state()
+    if branch != "master":
+        print(f"❌ Must be on master branch (currently on {branch})")
+        sys.exit(1)
+    if dirty:
+        print("❌ You have uncommitted changes. Commit or stash them first.")
         sys.exit(1)
 
 
@@ -272,58 +326,39 @@ def pull_latest() -> None:
             ["git", "pull", "origin", "master"],
             check=True,
         )
+        invalidate_caches()
         print("✓ Pulled latest changes")
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to pull from origin/master: {e}")
         sys.exit(1)
 
 
-def create_release_branch(version: str) -> None:
-    """Create branch release/vX.X.X and check it out."""
+def create_release_commit(version: str) -> None:
+    """Create branch release/vX.X.X, commit release files, and push to origin."""
     branch = f"release/v{version}"
+    commit_msg = f"Prepare release v{version}"
     try:
         subprocess.run(
             ["git", "checkout", "-b", branch],
             check=True,
         )
         print(f"✓ Created and checked out branch {branch}")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to create branch {branch}: {e}")
-        sys.exit(1)
-
-
-def commit_changes(version: str) -> None:
-    """Stage pyproject.toml, CHANGELOG.md, and uv.lock, commit with message."""
-    try:
-        # Stage files
-        subprocess.run(
-            ["git", "add", "pyproject.toml", "CHANGELOG.md", "uv.lock"],
-            check=True,
-        )
 
-        # Commit with message
-        commit_msg = f"Prepare release v{version}"
+        # Committing pathspecs stages them too, so no separate git add
         subprocess.run(
-            ["git", "commit", "-m", commit_msg],
+            [
+                "git",
+                "commit",
+                "-m",
+                commit_msg,
+                "--",
+                "pyproject.toml",
+                "CHANGELOG.md",
+                "uv.lock",
+            ],
             check=True,
         )
         print(f"✓ Committed changes: {commit_msg}")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to commit changes: {e}")
-        sys.exit(1)
-
-
-def push_branch() -> None:
-    """Push current branch to origin with -u flag."""
-    try:
-        # Get current branch name
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        branch = result.stdout.strip()
 
         # Push with upstream tracking
         subprocess.run(
@@ -332,12 +367,16 @@ def push_branch() -> None:
         )
         print(f"✓ Pushed branch {branch} to origin")
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to push branch: {e}")
+        print(f"❌ Failed to prepare release branch {branch}: {e}")
         sys.exit(1)
 
 
-def create_release_pr(version: str, changelog_entry: str) -> None:
+def create_release_pr(
+    version: str, changelog_entry: str, date: str | None = None
+) -> None:
     """Create PR using template with version placeholders replaced."""
+    import tempfile
+
     # Use absolute path relative to script location
     project_root = Path(__file__).parent.parent
     template_path = project_root / ".github" / "RELEASE_PULL_REQUEST_TEMPLATE.md"
@@ -351,7 +390,7 @@ def create_release_pr(version: str, changelog_entry: str) -> None:
         template_content = template_path.read_text()
 
         # Generate version anchor and extract changes using utility functions
-        version_anchor = release_utils.generate_version_anchor(version)
+        version_anchor = release_utils.generate_version_anchor(version, date)
         changes = release_utils.extract_changes_from_entry(changelog_entry)
 
         # Replace placeholders
@@ -375,6 +414,9 @@ def create_release_pr(version: str, changelog_entry: str) -> None:
                     "create",
                     "--base",
                     "master",
+                    # Known branch name, so gh doesn't have to ask git for it
+                    "--head",
+                    f"release/v{version}",
                     "--title",
                     f"Release v{version}",
                     "--body-file",
@@ -404,8 +446,7 @@ def create_release_pr(version: str, changelog_entry: str) -> None:
 
 if __name__ == "__main__":
     # Pre-flight checks
-    verify_on_master()
-    verify_clean_working_dir()
+    verify_preflight()
     pull_latest()
 
     # Show warning
@@ -422,16 +463,16 @@ if __name__ == "__main__":
         print("\n❌ Release cancelled.")
         sys.exit(0)
 
-    # Generate changelog
+    # Generate changelog (one date for the entry and the PR's anchor link)
+    release_date = release_utils.today()
     last_tag = get_last_release_tag()
     commits = get_commits_since(last_tag)
 
     if not commits or commits == [""]:
         print("\n⚠️  No commits found since last release.")
-        date = datetime.now().strftime("%Y-%m-%d")
-        changelog_entry = f"## [{new_version}] - {date}\n\n- No changes"
+        changelog_entry = f"## [{new_version}] - {release_date}\n\n- No changes"
     else:
-        changelog_entry = generate_changelog_entry(new_version, commits)
+        changelog_entry = generate_changelog_entry(new_version, commits, release_date)
 
     # Preview and confirm
     if not preview_changelog(changelog_entry):
@@ -446,13 +487,11 @@ if __name__ == "__main__":
 
     # Git operations
     print("\n🚀 Creating release branch and committing changes...")
-    create_release_branch(new_version)
-    commit_changes(new_version)
-    push_branch()
+    create_release_commit(new_version)
 
     # Create PR
     print("\n📝 Creating release PR...")
-    create_release_pr(new_version, changelog_entry)
+    create_release_pr(new_version, changelog_entry, release_date)
 
     print(f"\n✅ Release v{new_version} PR created!")
     print("\nNext steps:")
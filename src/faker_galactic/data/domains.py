@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistryConfig:
     """Configuration for weighted starship registry pattern generation."""
 
@@ -11,7 +11,7 @@ class RegistryConfig:
     weight: float  # Probability weight for selection
 
 
-@dataclass
+@dataclass(slots=True)
 class CanonicalCharacter:
     """Complete profile for a canonical sci-fi character."""
 
@@ -6,7 +6,7 @@ from .domains import CanonicalCharacter, RegistryConfig
 class StarTrekData:
     """Star Trek universe data spanning multiple series."""
 
-    FIRST_NAMES_MALE = [
+    FIRST_NAMES_MALE = (
         "James",
         "Spock",
         "Leonard",
@@ -37,9 +37,9 @@ class StarTrekData:
         "Hugh",
         "Sarek",
         "Khan",
-    ]
+    )
 
-    FIRST_NAMES_FEMALE = [
+    FIRST_NAMES_FEMALE = (
         "Nyota",
         "Christine",
         "Deanna",
@@ -70,9 +70,9 @@ class StarTrekData:
         "Janice",
         "Marlena",
         "Number One",
-    ]
+    )
 
-    LAST_NAMES_MALE = [
+    LAST_NAMES_MALE = (
         "Kirk",
         "Vulcan",
         "McCoy",
@@ -103,9 +103,9 @@ class StarTrekData:
         "Boimler",
         "Mariner",
         "Rutherford",
-    ]
+    )
 
-    LAST_NAMES_FEMALE = [
+    LAST_NAMES_FEMALE = (
         "Uhura",
         "Chapel",
         "Troi",
@@ -126,9 +126,9 @@ class StarTrekData:
         "Rand",
         "Moreau",
         "Freeman",
-    ]
+    )
 
-    RANKS = [
+    RANKS = (
         "Captain",
         "Commander",
         "Lieutenant Commander",
@@ -148,9 +148,9 @@ class StarTrekData:
         "Kai",
         "Vedek",
         "Emissary",
-    ]
+    )
 
-    STARSHIPS = [
+    STARSHIPS = (
         "USS Enterprise",
         "USS Voyager",
         "USS Defiant",
@@ -175,16 +175,16 @@ class StarTrekData:
         "USS Lexington",
         "USS Constellation",
         "USS Republic",
-    ]
+    )
 
-    STARSHIP_REGISTRIES = [
+    STARSHIP_REGISTRIES = (
         RegistryConfig(pattern="NCC-####", weight=0.4),  # 4-digit (classic era)
         RegistryConfig(pattern="NCC-#####", weight=0.3),  # 5-digit (TNG era)
         RegistryConfig(pattern="NX-#####", weight=0.2),  # Experimental (NX-01)
         RegistryConfig(pattern="NAR-#####", weight=0.1),  # Civilian registry
-    ]
+    )
 
-    STARSHIP_CLASSES = [
+    STARSHIP_CLASSES = (
         "Constitution-class",
         "Galaxy-class",
         "Intrepid-class",
@@ -203,9 +203,9 @@ class StarTrekData:
         "Luna-class",
         "California-class",
         "NX-class",
-    ]
+    )
 
-    BASE_LOCATIONS = [
+    BASE_LOCATIONS = (
         "Federation Headquarters",
         "Starfleet Academy",
         "Memory Alpha",
@@ -221,9 +221,9 @@ class StarTrekData:
         "McKinley Station",
         "Spacedock",
         "Paradise City",
-    ]
+    )
 
-    LOCATION_DETAILS = [
+    LOCATION_DETAILS = (
         "Recreation Deck",
         "Holosuite",
         "Gymnasium",
@@ -244,9 +244,9 @@ class StarTrekData:
         "Engineering",
         "Cargo Bay",
         "Transporter Room",
-    ]
+    )
 
-    LANGUAGES = [
+    LANGUAGES = (
         "Federation Standard",
         "English",
         "Klingon",
@@ -261,9 +261,9 @@ class StarTrekData:
         "Trill",
         "Borg",
         "Dominion",
-    ]
+    )
 
-    QUOTES = [
+    QUOTES = (
         "Live long and prosper.",
         "Make it so.",
         "Engage!",
@@ -284,9 +284,9 @@ class StarTrekData:
         "I have been and always shall be your friend.",
         "Set phasers to stun.",
         "There's coffee in that nebula!",
-    ]
+    )
 
-    CANONICAL_CHARACTERS = [
+    CANONICAL_CHARACTERS = (
         CanonicalCharacter(
             first_name="Jean-Luc",
             last_name="Picard",
@@ -519,4 +519,4 @@ class StarTrekData:
             language="English",
             quotes=[],
         ),
-    ]
+    )
@@ -1,7 +1,12 @@
 """Faker provider for sci-fi themed data."""
 
+import functools
+import itertools
 import logging
-from typing import Literal, TypeVar, cast, overload
+import random
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast, overload
 
 from faker.providers import BaseProvider
 
@@ -13,52 +18,102 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
-# Static universe registry
-UNIVERSES = {
-    "startrek": StarTrekData(),
-    # Future: 'starwars': StarWarsData(),
+# Static universe registry (read-only view)
+UNIVERSES = MappingProxyType(
+    {
+        "startrek": StarTrekData(),
+        # Future: 'starwars': StarWarsData(),
+    }
+)
+_UNIVERSE_NAMES = tuple(UNIVERSES)
+
+# Attributes whose data is a sequence of strings
+StringAttribute = Literal[
+    UniverseAttribute.FIRST_NAMES_MALE,
+    UniverseAttribute.FIRST_NAMES_FEMALE,
+    UniverseAttribute.LAST_NAMES_MALE,
+    UniverseAttribute.LAST_NAMES_FEMALE,
+    UniverseAttribute.RANKS,
+    UniverseAttribute.STARSHIPS,
+    UniverseAttribute.STARSHIP_CLASSES,
+    UniverseAttribute.BASE_LOCATIONS,
+    UniverseAttribute.LOCATION_DETAILS,
+    UniverseAttribute.LANGUAGES,
+    UniverseAttribute.QUOTES,
+]
+
+# Per-universe data keyed by (universe, attribute), resolved once at import
+_UNIVERSE_DATA: dict[tuple[str, UniverseAttribute], Sequence[Any]] = {
+    (name, attr): getattr(univ_data, attr.value)
+    for name, univ_data in UNIVERSES.items()
+    for attr in UniverseAttribute
 }
 
+# Data from all universes combined, used in mixed mode (universe=None)
+_MIXED_DATA: dict[UniverseAttribute, tuple[Any, ...]] = {
+    attr: tuple(
+        itertools.chain.from_iterable(
+            _UNIVERSE_DATA[(name, attr)] for name in UNIVERSES
+        )
+    )
+    for attr in UniverseAttribute
+}
 
-class SciFiProvider(BaseProvider):
-    """Faker provider for sci-fi themed data."""
+# Characters Faker's bothify() replaces with random digits or letters
+_BOTHIFY_PLACEHOLDERS = frozenset("#%$!@?")
 
-    @overload
-    def _get_data(
-        self,
-        attr: Literal[
-            UniverseAttribute.FIRST_NAMES_MALE,
-            UniverseAttribute.FIRST_NAMES_FEMALE,
-            UniverseAttribute.LAST_NAMES_MALE,
-            UniverseAttribute.LAST_NAMES_FEMALE,
-            UniverseAttribute.RANKS,
-            UniverseAttribute.STARSHIPS,
-            UniverseAttribute.STARSHIP_CLASSES,
-            UniverseAttribute.BASE_LOCATIONS,
-            UniverseAttribute.LOCATION_DETAILS,
-            UniverseAttribute.LANGUAGES,
-            UniverseAttribute.QUOTES,
-        ],
-        universe: str | None = None,
-    ) -> list[str]: ...
+# Concatenated string data keyed by (universe, attributes); data is static
+_COMBINED_DATA: dict[
+    tuple[str | None, tuple[StringAttribute, ...]], tuple[str, ...]
+] = {}
 
-    @overload
-    def _get_data(
-        self,
-        attr: Literal[UniverseAttribute.STARSHIP_REGISTRIES],
-        universe: str | None = None,
-    ) -> list[RegistryConfig]: ...
 
-    @overload
-    def _get_data(
-        self,
-        attr: Literal[UniverseAttribute.CANONICAL_CHARACTERS],
-        universe: str | None = None,
-    ) -> list[CanonicalCharacter]: ...
+@functools.cache
+def _parse_digit_registry(pattern: str) -> tuple[str, int] | None:
+    """
+    Split a registry pattern like "NCC-####" into ("NCC", 4).
+
+    Returns None when the pattern has any other bothify() placeholder, so
+    callers can fall back to Faker for it.
+    """
+    prefix, sep, digits = pattern.partition("-")
+    if not sep or not digits or digits.strip("#"):
+        return None
+    if any(char in _BOTHIFY_PLACEHOLDERS for char in prefix):
+        return None
+    return prefix, len(digits)
+
+
+class SciFiProvider(BaseProvider):
+    """Faker provider for sci-fi themed data."""
+
+    # Overloads only matter to type checkers; skip building them at runtime
+    if TYPE_CHECKING:
+
+        @overload
+        def _get_data(
+            self,
+            attr: StringAttribute,
+            universe: str | None = None,
+        ) -> Sequence[str]: ...
+
+        @overload
+        def _get_data(
+            self,
+            attr: Literal[UniverseAttribute.STARSHIP_REGISTRIES],
+            universe: str | None = None,
+        ) -> Sequence[RegistryConfig]: ...
+
+        @overload
+        def _get_data(
+            self,
+            attr: Literal[UniverseAttribute.CANONICAL_CHARACTERS],
+            universe: str | None = None,
+        ) -> Sequence[CanonicalCharacter]: ...
 
     def _get_data(
         self, attr: UniverseAttribute, universe: str | None = None
-    ) -> list[str] | list[RegistryConfig] | list[CanonicalCharacter]:
+    ) -> Sequence[str] | Sequence[RegistryConfig] | Sequence[CanonicalCharacter]:
         """
         Get data attribute from universe(s).
 
@@ -70,19 +125,19 @@ class SciFiProvider(BaseProvider):
             universe: Universe name to get data from, or None for mixed mode
 
         Returns:
-            List of data from requested universe or all universes
+            Sequence of data from requested universe or all universes
 
         Raises:
             ValueError: If universe name is not in registry
         """
         if universe:
-            if universe not in UNIVERSES:
+            try:
+                data = _UNIVERSE_DATA[(universe, attr)]
+            except KeyError:
                 raise ValueError(
                     f"Unknown universe '{universe}'. "
-                    f"Available: {list(UNIVERSES.keys())}"
-                )
-
-            data = getattr(UNIVERSES[universe], attr.value)
+                    f"Available: {list(_UNIVERSE_NAMES)}"
+                ) from None
 
             # Fallback to mixed mode if universe doesn't provide this data
             if not data:
@@ -93,29 +148,60 @@ class SciFiProvider(BaseProvider):
                 universe = None
 
         if universe is None:
-            # Collect from all universes
-            data = []
-            for univ_data in UNIVERSES.values():
-                universe_attr = getattr(univ_data, attr.value)
-                if isinstance(universe_attr, list):
-                    data.extend(universe_attr)
+            # Collected from all universes at import
+            data = _MIXED_DATA[attr]
+
+        return cast(
+            Sequence[str] | Sequence[RegistryConfig] | Sequence[CanonicalCharacter],
+            data,
+        )
 
-        return cast(list[str] | list[RegistryConfig] | list[CanonicalCharacter], data)
+    def _get_combined_data(
+        self, universe: str | None, *attrs: StringAttribute
+    ) -> tuple[str, ...]:
+        """
+        Get several string attributes concatenated into one tuple.
+
+        The result is cached per universe so hot paths like scifi_first_name()
+        don't rebuild the concatenation on every call.
+
+        Args:
+            universe: Universe name to get data from, or None for mixed mode
+            *attrs: Attributes to concatenate, in order
 
-    def _random_element(self, items: list[T]) -> T:
-        """Type-safe wrapper for random_element.
+        Returns:
+            Concatenated data from the requested attributes
 
-        Centralizes the cast needed for Faker's untyped random_element() method.
+        Raises:
+            ValueError: If universe name is not in registry
         """
-        return self.random_element(items)
+        key = (universe, attrs)
+        combined = _COMBINED_DATA.get(key)
+        if combined is None:
+            combined = tuple(
+                item for attr in attrs for item in self._get_data(attr, universe)
+            )
+            _COMBINED_DATA[key] = combined
+        return combined
+
+    def _random_element(self, items: Sequence[T]) -> T:
+        """Pick a uniformly random item using the generator's seeded RNG.
+
+        Calls random.choice() directly rather than Faker's random_element(),
+        which goes through random_elements() and builds a temporary list.
+        """
+        rng: random.Random = self.generator.random
+        return rng.choice(items)
 
     # Name methods
 
     def scifi_first_name(self, universe: str | None = None) -> str:
         """Generate sci-fi first name (any gender)."""
-        male_names = self._get_data(UniverseAttribute.FIRST_NAMES_MALE, universe)
-        female_names = self._get_data(UniverseAttribute.FIRST_NAMES_FEMALE, universe)
-        all_names = male_names + female_names
+        all_names = self._get_combined_data(
+            universe,
+            UniverseAttribute.FIRST_NAMES_MALE,
+            UniverseAttribute.FIRST_NAMES_FEMALE,
+        )
         return self._random_element(all_names)
 
     def scifi_first_name_male(self, universe: str | None = None) -> str:
@@ -130,9 +216,11 @@ class SciFiProvider(BaseProvider):
 
     def scifi_last_name(self, universe: str | None = None) -> str:
         """Generate sci-fi last name (any gender)."""
-        male_names = self._get_data(UniverseAttribute.LAST_NAMES_MALE, universe)
-        female_names = self._get_data(UniverseAttribute.LAST_NAMES_FEMALE, universe)
-        all_names = male_names + female_names
+        all_names = self._get_combined_data(
+            universe,
+            UniverseAttribute.LAST_NAMES_MALE,
+            UniverseAttribute.LAST_NAMES_FEMALE,
+        )
         return self._random_element(all_names)
 
     def scifi_last_name_male(self, universe: str | None = None) -> str:
@@ -186,6 +274,16 @@ class SciFiProvider(BaseProvider):
         registry_config = self._random_element(registries)
         pattern = registry_config.pattern
 
+        # Fast path for all-digit patterns: "NCC-####" -> one zero-padded draw
+        digit_pattern = _parse_digit_registry(pattern)
+        if digit_pattern is not None:
+            prefix, width = digit_pattern
+            if prefix_only:
+                return prefix  # "NCC"
+            rng: random.Random = self.generator.random
+            number = f"{rng.randrange(10**width):0{width}d}"
+            return number if number_only else f"{prefix}-{number}"
+
         # Use Faker's bothify to generate from pattern  ("NCC-####" -> "NCC-1701")
         full_registry = self.bothify(pattern)
 
@@ -210,12 +308,12 @@ class SciFiProvider(BaseProvider):
         - "Starfleet Academy Holodeck"
         - "Quark's Bar Back Room"
         """
-        starships = self._get_data(UniverseAttribute.STARSHIPS, universe)
-        base_locations = self._get_data(UniverseAttribute.BASE_LOCATIONS, universe)
+        all_bases = self._get_combined_data(
+            universe, UniverseAttribute.STARSHIPS, UniverseAttribute.BASE_LOCATIONS
+        )
         location_details = self._get_data(UniverseAttribute.LOCATION_DETAILS, universe)
 
         # Pick either a starship or base location
-        all_bases = starships + base_locations
         base = self._random_element(all_bases)
         detail = self._random_element(location_details)
 
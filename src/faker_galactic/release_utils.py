@@ -5,10 +5,26 @@ All file operations, git commands, and user interactions are handled
 in scripts/release.py which imports these utilities.
 """
 
+import functools
 import re
 from datetime import datetime
+from typing import NamedTuple
 
+# "abc1234 Commit message (#123)" -> message, optional trailing PR number
+_COMMIT_RE = re.compile(r"^[a-f0-9]+\s+(.+?)(?:\s+\(#(\d+)\))?$")
+_HEX_DIGITS = "0123456789abcdef"
 
+
+def today() -> str:
+    """Return today's date in changelog format (YYYY-MM-DD).
+
+    Callers producing several date-stamped strings for one release should
+    call this once and pass the result along, so they can't disagree.
+    """
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=256)
 def parse_version(version: str) -> tuple[int, int, int]:
     """Parse semver string into (major, minor, patch).
 
@@ -21,30 +37,42 @@ def parse_version(version: str) -> tuple[int, int, int]:
     Raises:
         ValueError: If version format is invalid
     """
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version)
-    if not match:
-        raise ValueError(f"Invalid version format: {version}")
-    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+    parts = version.split(".")
+    if len(parts) == 3:
+        major, minor, patch = parts
+        # isdecimal() matches what int() accepts, unlike isdigit() ("²")
+        if major.isdecimal() and minor.isdecimal() and patch.isdecimal():
+            return int(major), int(minor), int(patch)
+    raise ValueError(f"Invalid version format: {version}")
+
+
+class Versions(NamedTuple):
+    """Candidate next versions for each kind of semver bump."""
+
+    patch: str
+    minor: str
+    major: str
 
 
-def calculate_versions(current: str) -> dict[str, str]:
+@functools.lru_cache(maxsize=128)
+def calculate_versions(current: str) -> Versions:
     """Calculate patch, minor, major versions from current version.
 
     Args:
         current: Current semantic version string
 
     Returns:
-        Dictionary with 'patch', 'minor', and 'major' version strings
+        Versions with patch, minor, and major version strings
 
     Raises:
         ValueError: If current version format is invalid
     """
     major, minor, patch = parse_version(current)
-    return {
-        "patch": f"{major}.{minor}.{patch + 1}",
-        "minor": f"{major}.{minor + 1}.0",
-        "major": f"{major + 1}.0.0",
-    }
+    return Versions(
+        patch=f"{major}.{minor}.{patch + 1}",
+        minor=f"{major}.{minor + 1}.0",
+        major=f"{major + 1}.0.0",
+    )
 
 
 def parse_commit_message(commit: str) -> tuple[str, str | None]:
@@ -58,10 +86,27 @@ def parse_commit_message(commit: str) -> tuple[str, str | None]:
     Returns:
         Tuple of (message, pr_number). PR number is None if not present.
     """
-    match = re.match(r"^[a-f0-9]+\s+(.+?)(?:\s+\(#(\d+)\))?$", commit)
+    # Fast path for the usual "<hash> <message>[ (#N)]" shape; anything the
+    # string methods can't decide the same way as _COMMIT_RE falls through.
+    sha, _, rest = commit.partition(" ")
+    if (
+        sha
+        and rest
+        and not sha.strip(_HEX_DIGITS)
+        and not rest[0].isspace()
+        and "\n" not in rest
+    ):
+        if "(#" not in rest:
+            return rest, None
+        head, sep, tail = rest.rpartition(" (#")
+        pr_num = tail[:-1]
+        if sep and tail[-1:] == ")" and pr_num.isdecimal():
+            return head.rstrip(), pr_num
+
+    match = _COMMIT_RE.match(commit)
     if not match:
         return commit, None
-    return match.group(1), match.group(2)
+    return match[1], match[2]
 
 
 def format_changelog_entry(
@@ -80,19 +125,21 @@ def format_changelog_entry(
         Formatted changelog entry string
     """
     if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
+        date = today()
 
-    lines = [f"## [{version}] - {date}\n"]
+    header = f"## [{version}] - {date}\n"
+    if not commits:
+        return header
 
-    for commit in commits:
-        message, pr_num = parse_commit_message(commit)
-        if pr_num:
-            pr_link = f"[#{pr_num}](https://github.com/{owner}/{repo}/pull/{pr_num})"
-            lines.append(f"- {message} {pr_link}")
-        else:
-            lines.append(f"- {message}")
+    pr_url = f"https://github.com/{owner}/{repo}/pull/"
+    body = "\n".join(
+        [
+            f"- {message} [#{pr_num}]({pr_url}{pr_num})" if pr_num else f"- {message}"
+            for message, pr_num in map(parse_commit_message, commits)
+        ]
+    )
 
-    return "\n".join(lines)
+    return f"{header}\n{body}"
 
 
 def generate_version_anchor(version: str, date: str | None = None) -> str:
@@ -108,7 +155,7 @@ def generate_version_anchor(version: str, date: str | None = None) -> str:
         Anchor string for linking to changelog section
     """
     if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
+        date = today()
     return f"{version.replace('.', '')}---{date}"
 
 
@@ -121,5 +168,5 @@ def extract_changes_from_entry(changelog_entry: str) -> str:
     Returns:
         Just the bullet-pointed changes without the header line
     """
-    lines = changelog_entry.split("\n")
-    return "\n".join(line for line in lines[1:] if line.strip())
+    _header, _, changes = changelog_entry.partition("\n")
+    return "\n".join([line for line in changes.split("\n") if line.strip()])
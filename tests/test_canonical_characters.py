@@ -60,6 +60,12 @@ class TestCanonicalCharacterDataclass:
 
         assert char.quotes == []
 
+    def test_canonical_character_uses_slots(self):
+        """Instances store fields in slots rather than a per-instance dict."""
+        char = CanonicalCharacter(first_name="Jadzia", last_name="Dax")
+
+        assert not hasattr(char, "__dict__")
+
 
 class TestCanonicalCharacterIntegration:
     """Integration tests with real Star Trek characters."""
@@ -3,8 +3,9 @@
 import pytest
 from faker import Faker
 
+from faker_galactic.data.constants import UniverseAttribute
 from faker_galactic.data.domains import CanonicalCharacter
-from faker_galactic.provider import UNIVERSES, SciFiProvider
+from faker_galactic.provider import UNIVERSES, SciFiProvider, _parse_digit_registry
 
 
 @pytest.fixture
@@ -137,6 +138,34 @@ class TestStarshipRegistry:
         assert result.isdigit()
         assert "-" not in result
 
+    def test_starship_registry_matches_configured_pattern(self, faker):
+        """Generated registries have the prefix and digit count of a pattern."""
+        shapes = {
+            (prefix, len(digits))
+            for prefix, _, digits in (
+                registry.pattern.partition("-")
+                for registry in UNIVERSES["startrek"].STARSHIP_REGISTRIES
+            )
+        }
+
+        for _ in range(50):
+            prefix, _, number = faker.starship_registry("startrek").partition("-")
+            assert (prefix, len(number)) in shapes
+
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            ("NCC-####", ("NCC", 4)),
+            ("NX-#####", ("NX", 5)),
+            ("NCC-?###", None),  # Letter placeholder needs bothify
+            ("NCC-%###", None),  # Non-zero digit placeholder needs bothify
+            ("NCC####", None),  # No separator
+        ],
+    )
+    def test_parse_digit_registry(self, pattern, expected):
+        """Only plain PREFIX-### patterns take the fast path."""
+        assert _parse_digit_registry(pattern) == expected
+
 
 class TestLocation:
     """Tests for scifi_location() method."""
@@ -198,6 +227,40 @@ class TestMixedUniverseMode:
         assert isinstance(result, CanonicalCharacter)
 
 
+class TestDataCaching:
+    """Tests for cached universe data lookups."""
+
+    def test_combined_data_is_reused_across_calls(self, faker):
+        """Concatenated name lists are built once and then reused."""
+        provider = SciFiProvider(faker)
+        first = provider._get_combined_data(
+            "startrek",
+            UniverseAttribute.FIRST_NAMES_MALE,
+            UniverseAttribute.FIRST_NAMES_FEMALE,
+        )
+        second = provider._get_combined_data(
+            "startrek",
+            UniverseAttribute.FIRST_NAMES_MALE,
+            UniverseAttribute.FIRST_NAMES_FEMALE,
+        )
+
+        assert first is second
+        assert first == (
+            UNIVERSES["startrek"].FIRST_NAMES_MALE
+            + UNIVERSES["startrek"].FIRST_NAMES_FEMALE
+        )
+
+    def test_mixed_mode_data_is_precomputed(self, faker):
+        """Mixed mode returns the same combined list instead of rebuilding it."""
+        provider = SciFiProvider(faker)
+
+        first = provider._get_data(UniverseAttribute.RANKS)
+        second = provider._get_data(UniverseAttribute.RANKS)
+
+        assert first is second
+        assert set(UNIVERSES["startrek"].RANKS) <= set(first)
+
+
 class TestErrorHandling:
     """Tests for error handling and validation."""
 
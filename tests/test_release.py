@@ -15,6 +15,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 import release
 
 
+@pytest.fixture(autouse=True)
+def clear_release_caches() -> None:
+    """Reset memoized git/pyproject lookups so each test sees its own mocks."""
+    release.invalidate_caches()
+
+
 class TestGetCurrentVersion:
     """Tests for reading version from pyproject.toml."""
 
@@ -43,6 +49,157 @@ description = "A test project"
         with pytest.raises(SystemExit):
             release.get_current_version()
 
+    @patch("release.Path")
+    def test_get_current_version_reads_project_table(self, mock_path: Mock) -> None:
+        """Test that a version key in another table is not picked up."""
+        mock_content = """
+[tool.example]
+version = "9.9.9"
+
+[project]
+name = "faker-galactic"
+version = "1.2.3"
+"""
+        mock_path.return_value.read_text.return_value = mock_content
+        assert release.get_current_version() == "1.2.3"
+
+    @pytest.mark.parametrize(
+        "mock_content",
+        ['project = "x"\n', 'project = ["1.2.3"]\n', "[project]\nversion = 1\n"],
+    )
+    @patch("release.Path")
+    def test_get_current_version_malformed_project(
+        self, mock_path: Mock, mock_content: str
+    ) -> None:
+        """Test error rather than traceback when project is not a table."""
+        mock_path.return_value.read_text.return_value = mock_content
+        with pytest.raises(SystemExit):
+            release.get_current_version()
+
+    @patch("release.Path")
+    def test_get_current_version_invalid_toml(self, mock_path: Mock) -> None:
+        """Test error when pyproject.toml cannot be parsed."""
+        mock_path.return_value.read_text.return_value = "[project\nversion = 1"
+        with pytest.raises(SystemExit):
+            release.get_current_version()
+
+
+class TestUpdateVersionInPyproject:
+    """Tests for rewriting the version in pyproject.toml."""
+
+    def test_update_version_preserves_rest_of_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only the project version line changes."""
+        content = """[project]
+name = "faker-galactic"
+version = "1.2.3"  # current release
+
+[tool.ruff]
+target-version = "py313"
+"""
+        (tmp_path / "pyproject.toml").write_text(content)
+        monkeypatch.chdir(tmp_path)
+
+        release.update_version_in_pyproject("1.3.0")
+
+        assert (tmp_path / "pyproject.toml").read_text() == content.replace(
+            '"1.2.3"', '"1.3.0"'
+        )
+        assert release.get_current_version() == "1.3.0"
+
+    def test_update_version_ignores_other_tables(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a version key in a table before [project] is untouched."""
+        content = """[tool.example]
+version = "9.9.9"
+
+[project]
+name = "faker-galactic"
+version = "1.2.3"
+
+[tool.other]
+version = "8.8.8"
+"""
+        (tmp_path / "pyproject.toml").write_text(content)
+        monkeypatch.chdir(tmp_path)
+
+        release.update_version_in_pyproject("1.2.4")
+
+        assert (tmp_path / "pyproject.toml").read_text() == content.replace(
+            '"1.2.3"', '"1.2.4"'
+        )
+        assert release.get_current_version() == "1.2.4"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '[tool.example]\nversion = "9.9.9"\n',
+            '[tool.example]\nversion = "9.9.9"\n\n[project]\nname = "x"\n',
+            '[project]\nversion = "1.2.3"\nversion = "1.2.3"\n',
+        ],
+    )
+    def test_update_version_project_version_not_updated(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, content: str
+    ) -> None:
+        """Test exit, leaving the file as is, when [project] can't be bumped."""
+        (tmp_path / "pyproject.toml").write_text(content)
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(SystemExit):
+            release.update_version_in_pyproject("1.2.4")
+
+        assert (tmp_path / "pyproject.toml").read_text() == content
+
+    def test_update_version_no_version_field(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test error when version field is missing."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "x"\n')
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(SystemExit):
+            release.update_version_in_pyproject("1.3.0")
+
+
+class TestUpdateChangelog:
+    """Tests for prepending an entry to CHANGELOG.md."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (
+                "# Changelog\n\nIntro.\n\n## [1.0.0] - 2024-12-01\n\n- Initial\n",
+                "# Changelog\n\nIntro.\n\n"
+                "## [1.1.0] - 2024-12-15\n\n- New\n\n"
+                "## [1.0.0] - 2024-12-01\n\n- Initial\n",
+            ),
+            (
+                "# Changelog\n\nIntro.\n",
+                "# Changelog\n\n## [1.1.0] - 2024-12-15\n\n- New\n\nIntro.\n",
+            ),
+            (
+                "# Changelog",
+                "# Changelog\n## [1.1.0] - 2024-12-15\n\n- New\n",
+            ),
+        ],
+    )
+    def test_update_changelog_insert_position(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        content: str,
+        expected: str,
+    ) -> None:
+        """Test entry goes before the first version, else after the header."""
+        (tmp_path / "CHANGELOG.md").write_text(content)
+        monkeypatch.chdir(tmp_path)
+
+        release.update_changelog("## [1.1.0] - 2024-12-15\n\n- New")
+
+        assert (tmp_path / "CHANGELOG.md").read_text() == expected
+
 
 class TestGetRepoInfo:
     """Tests for extracting repo info from git remote."""
@@ -53,6 +210,8 @@ class TestGetRepoInfo:
             ("https://github.com/owner/repo.git\n", "owner", "repo"),
             ("git@github.com:owner/repo.git\n", "owner", "repo"),
             ("https://github.com/test-org/my-project.git\n", "test-org", "my-project"),
+            ("https://github.com/owner/faker.js.git\n", "owner", "faker.js"),
+            ("ssh://git@github.com/owner/repo\n", "owner", "repo"),
         ],
     )
     @patch("subprocess.run")
@@ -76,6 +235,28 @@ class TestGetRepoInfo:
         with pytest.raises(SystemExit):
             release.get_repo_info()
 
+    @patch("subprocess.run")
+    def test_get_repo_info_cached(self, mock_run: Mock) -> None:
+        """Test that repeated calls reuse the first git lookup."""
+        mock_run.return_value = Mock(stdout="git@github.com:owner/repo.git\n")
+        assert release.get_repo_info() == release.get_repo_info()
+        mock_run.assert_called_once()
+
+
+class TestPullLatest:
+    """Tests for pulling from origin/master."""
+
+    @patch("subprocess.run")
+    def test_pull_latest_invalidates_caches(self, mock_run: Mock) -> None:
+        """Test that lookups cached before a pull are refreshed after it."""
+        mock_run.return_value = Mock(stdout="v1.0.0\n")
+        assert release.get_last_release_tag() == "v1.0.0"
+
+        release.pull_latest()
+        mock_run.return_value = Mock(stdout="v1.1.0\n")
+
+        assert release.get_last_release_tag() == "v1.1.0"
+
 
 class TestGetLastReleaseTag:
     """Tests for getting the last release tag."""
@@ -107,6 +288,7 @@ class TestGetCommitsSince:
             stdout="abc1234 Commit 1\ndef5678 Commit 2\n", returncode=0
         )
         commits = release.get_commits_since("v1.0.0")
+        assert mock_run.call_args[0][0][-2:] == ("--format=%h %s", "v1.0.0..HEAD")
         assert len(commits) == 2
         assert commits[0] == "abc1234 Commit 1"
         assert commits[1] == "def5678 Commit 2"
@@ -123,6 +305,55 @@ class TestGetCommitsSince:
         assert ".." not in " ".join(call_args)
 
 
+class TestCreateReleaseCommit:
+    """Tests for creating, committing and pushing the release branch."""
+
+    @patch("subprocess.run")
+    def test_create_release_commit(self, mock_run: Mock) -> None:
+        """Test branch, commit and push run without extra git lookups."""
+        release.create_release_commit("1.2.0")
+
+        commands = [call[0][0] for call in mock_run.call_args_list]
+        assert commands == [
+            ["git", "checkout", "-b", "release/v1.2.0"],
+            [
+                "git",
+                "commit",
+                "-m",
+                "Prepare release v1.2.0",
+                "--",
+                "pyproject.toml",
+                "CHANGELOG.md",
+                "uv.lock",
+            ],
+            ["git", "push", "-u", "origin", "release/v1.2.0"],
+        ]
+
+    @patch("subprocess.run")
+    def test_create_release_commit_failure(self, mock_run: Mock) -> None:
+        """Test exit when a git step fails."""
+        import subprocess
+
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+        with pytest.raises(SystemExit):
+            release.create_release_commit("1.2.0")
+
+
+class TestCreateReleasePr:
+    """Tests for opening the release PR with gh."""
+
+    @patch("subprocess.run")
+    def test_create_release_pr_passes_branch(self, mock_run: Mock) -> None:
+        """Test the release branch is passed to gh rather than looked up."""
+        mock_run.return_value = Mock(stdout="https://github.com/o/r/pull/9\n")
+
+        release.create_release_pr("1.2.0", "## [1.2.0] - 2024-12-01\n\n- Change")
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[args.index("--head") + 1] == "release/v1.2.0"
+
+
 class TestGenerateChangelogEntry:
     """Integration test for generate_changelog_entry wrapper."""
 
@@ -140,3 +371,53 @@ class TestGenerateChangelogEntry:
         assert "## [1.0.0]" in result
         assert "Add feature" in result
         assert "#123" in result
+
+    @patch("release.get_repo_info")
+    def test_generate_changelog_entry_uses_given_date(
+        self, mock_get_repo: Mock
+    ) -> None:
+        """Test that a caller-supplied release date is used in the header."""
+        mock_get_repo.return_value = ("owner", "repo")
+
+        result = release.generate_changelog_entry("1.0.0", [], "2024-12-15")
+
+        assert result == "## [1.0.0] - 2024-12-15\n"
+
+
+class TestGetGitState:
+    """Tests for reading branch and dirty state from git status."""
+
+    @patch("subprocess.run")
+    def test_get_git_state_clean(self, mock_run: Mock) -> None:
+        """Test clean working directory on master."""
+        mock_run.return_value = Mock(
+            stdout="# branch.oid abc1234\0# branch.head master\0"
+            "# branch.upstream origin/master\0# branch.ab +0 -0\0"
+        )
+        assert release.get_git_state() == ("master", False)
+        mock_run.assert_called_once()
+
+    @patch("subprocess.run")
+    def test_get_git_state_dirty(self, mock_run: Mock) -> None:
+        """Test uncommitted changes on a feature branch."""
+        mock_run.return_value = Mock(
+            stdout="# branch.oid abc1234\0# branch.head feature\0"
+            "1 .M N... 100644 100644 100644 abc1234 abc1234 README.md\0"
+        )
+        assert release.get_git_state() == ("feature", True)
+
+    @pytest.mark.parametrize(
+        "status_output",
+        [
+            "# branch.oid abc1234\0# branch.head feature\0",
+            "# branch.oid abc1234\0# branch.head (detached)\0",
+            "# branch.head master\0"
+            "1 M. N... 100644 100644 100644 abc1234 def5678 pyproject.toml\0",
+        ],
+    )
+    @patch("subprocess.run")
+    def test_verify_preflight_fails(self, mock_run: Mock, status_output: str) -> None:
+        """Test exit when not on master or working directory is dirty."""
+        mock_run.return_value = Mock(stdout=status_output)
+        with pytest.raises(SystemExit):
+            release.verify_preflight()
@@ -33,6 +33,9 @@ class TestParseVersion:
             "1.a.0",  # Non-numeric
             "v1.0.0",  # Has prefix
             "1.0.0.0",  # Too many parts
+            "1..0",  # Empty part
+            "1.².0",  # Digit int() can't parse
+            "1.0.0\n",  # Trailing newline
         ],
     )
     def test_parse_version_invalid(self, invalid_version: str) -> None:
@@ -61,9 +64,9 @@ class TestCalculateVersions:
     ) -> None:
         """Test version calculation with valid inputs."""
         versions = release_utils.calculate_versions(current)
-        assert versions["patch"] == expected_patch
-        assert versions["minor"] == expected_minor
-        assert versions["major"] == expected_major
+        assert versions.patch == expected_patch
+        assert versions.minor == expected_minor
+        assert versions.major == expected_major
 
     @pytest.mark.parametrize(
         "invalid_version",
@@ -79,6 +82,14 @@ class TestCalculateVersions:
         with pytest.raises(ValueError):
             release_utils.calculate_versions(invalid_version)
 
+    def test_calculate_versions_cached_and_read_only(self) -> None:
+        """Test repeated calls share one result that callers cannot mutate."""
+        versions = release_utils.calculate_versions("1.2.3")
+
+        assert release_utils.calculate_versions("1.2.3") is versions
+        with pytest.raises(AttributeError):
+            versions.patch = "9.9.9"  # type: ignore[misc]
+
 
 class TestParseCommitMessage:
     """Tests for parse_commit_message function."""
@@ -90,6 +101,9 @@ class TestParseCommitMessage:
             ("def5678 Fix typo in README", "Fix typo in README", None),
             ("abc1234 Merge PRs (#100) and (#200)", "Merge PRs (#100) and", "200"),
             ("not-a-valid-format", "not-a-valid-format", None),
+            ("abc1234 Tab-separated\t(#7)", "Tab-separated", "7"),
+            ("abc1234 Unclosed (#12", "Unclosed (#12", None),
+            ("ABC1234 Uppercase hash (#1)", "ABC1234 Uppercase hash (#1)", None),
         ],
     )
     def test_parse_commit_message(
@@ -126,6 +140,21 @@ class TestFormatChangelogEntry:
         )
         assert "- ghi9012 Update documentation" in result
 
+    def test_format_changelog_entry_exact_layout(self) -> None:
+        """Test header, blank line, then one bullet per commit."""
+        commits = ["abc1234 Add new feature (#123)", "def5678 Fix typo"]
+
+        result = release_utils.format_changelog_entry(
+            "1.2.0", commits, "owner", "repo", date="2024-12-01"
+        )
+
+        assert result == (
+            "## [1.2.0] - 2024-12-01\n"
+            "\n"
+            "- Add new feature [#123](https://github.com/owner/repo/pull/123)\n"
+            "- Fix typo"
+        )
+
     def test_format_changelog_entry_no_commits(self) -> None:
         """Test changelog generation with no commits."""
         result = release_utils.format_changelog_entry(
@@ -6,56 +6,55 @@ from faker_galactic.data.constants import UniverseAttribute
 from faker_galactic.data.domains import CanonicalCharacter, RegistryConfig
 from faker_galactic.provider import UNIVERSES
 
+_ALL_ATTRS = tuple(attr.value for attr in UniverseAttribute)
+_NAME_ATTRS = (
+    UniverseAttribute.FIRST_NAMES_MALE.value,
+    UniverseAttribute.FIRST_NAMES_FEMALE.value,
+    UniverseAttribute.LAST_NAMES_MALE.value,
+    UniverseAttribute.LAST_NAMES_FEMALE.value,
+)
 
-@pytest.mark.parametrize("universe_name", UNIVERSES.keys())
+_each_universe = pytest.mark.parametrize("universe_name", tuple(UNIVERSES))
+
+
+@_each_universe
 def test_universe_has_all_required_attributes(universe_name):
     """All universes must have all required attributes defined."""
-    universe = UNIVERSES[universe_name]
+    missing = set(_ALL_ATTRS).difference(dir(UNIVERSES[universe_name]))
 
-    for attr in UniverseAttribute:
-        assert hasattr(
-            universe, attr.value
-        ), f"Universe '{universe_name}' missing attribute: {attr.value}"
+    assert not missing, f"Universe '{universe_name}' missing attributes: {missing}"
 
 
-@pytest.mark.parametrize("universe_name", UNIVERSES.keys())
+@_each_universe
 def test_universe_has_non_empty_data(universe_name):
     """All universes must have non-empty data for all required attributes."""
     universe = UNIVERSES[universe_name]
 
-    for attr in UniverseAttribute:
-        data = getattr(universe, attr.value)
-        assert data, f"Universe '{universe_name}' has empty {attr.value}"
-        assert len(data) > 0, f"Universe '{universe_name}' has empty {attr.value}"
+    for attr in _ALL_ATTRS:
+        assert getattr(universe, attr), f"Universe '{universe_name}' has empty {attr}"
 
 
-@pytest.mark.parametrize("universe_name", UNIVERSES.keys())
-def test_universe_name_lists_are_lists_of_strings(universe_name):
-    """Name attributes must be lists of non-empty strings."""
+@_each_universe
+def test_universe_name_lists_are_tuples_of_strings(universe_name):
+    """Name attributes must be tuples of non-empty strings."""
     universe = UNIVERSES[universe_name]
 
-    name_attrs = [
-        UniverseAttribute.FIRST_NAMES_MALE,
-        UniverseAttribute.FIRST_NAMES_FEMALE,
-        UniverseAttribute.LAST_NAMES_MALE,
-        UniverseAttribute.LAST_NAMES_FEMALE,
-    ]
-
-    for attr in name_attrs:
-        data = getattr(universe, attr.value)
-        assert isinstance(data, list), f"{attr.value} must be a list"
-        for name in data:
-            assert isinstance(name, str), f"{attr.value} must contain strings"
-            assert name.strip(), f"{attr.value} contains empty string"
+    for attr in _NAME_ATTRS:
+        data = getattr(universe, attr)
+        assert isinstance(data, tuple), f"{attr} must be a tuple"
+        assert all(
+            isinstance(name, str) for name in data
+        ), f"{attr} must contain strings"
+        assert all(name.strip() for name in data), f"{attr} contains empty string"
 
 
-@pytest.mark.parametrize("universe_name", UNIVERSES.keys())
+@_each_universe
 def test_universe_canonical_characters_are_valid(universe_name):
     """Canonical characters must be valid CanonicalCharacter instances."""
     universe = UNIVERSES[universe_name]
     characters = universe.CANONICAL_CHARACTERS
 
-    assert isinstance(characters, list), "CANONICAL_CHARACTERS must be a list"
+    assert isinstance(characters, tuple), "CANONICAL_CHARACTERS must be a tuple"
     assert len(characters) > 0, "CANONICAL_CHARACTERS must not be empty"
 
     for char in characters:
@@ -67,22 +66,27 @@ def test_universe_canonical_characters_are_valid(universe_name):
         # Other fields (rank, starship, etc.) are optional
 
 
-@pytest.mark.parametrize("universe_name", UNIVERSES.keys())
+@_each_universe
 def test_universe_starship_registries_have_valid_format(universe_name):
     """Starship registries must be valid RegistryConfig instances."""
     universe = UNIVERSES[universe_name]
     registries = universe.STARSHIP_REGISTRIES
 
-    assert isinstance(registries, list), "STARSHIP_REGISTRIES must be a list"
+    assert isinstance(registries, tuple), "STARSHIP_REGISTRIES must be a tuple"
     assert len(registries) > 0, "STARSHIP_REGISTRIES must not be empty"
 
-    for registry in registries:
-        assert isinstance(
-            registry, RegistryConfig
-        ), "Each registry must be a RegistryConfig instance"
-        assert isinstance(registry.pattern, str), "Pattern must be a string"
-        assert isinstance(registry.weight, int | float), "Weight must be numeric"
-        assert registry.weight > 0, "Weight must be positive"
+    # RegistryConfig instances with a string pattern and a positive weight
+    invalid = [
+        registry
+        for registry in registries
+        if not (
+            isinstance(registry, RegistryConfig)
+            and isinstance(registry.pattern, str)
+            and isinstance(registry.weight, int | float)
+            and registry.weight > 0
+        )
+    ]
+    assert not invalid, f"Universe '{universe_name}' has invalid registries: {invalid}"
 
 
 def test_startrek_has_sufficient_variety():
@@ -106,3 +110,9 @@ def test_universe_registry_keys():
     """Verify expected universes are registered."""
     assert "startrek" in UNIVERSES, "Star Trek universe should be registered"
     assert len(UNIVERSES) >= 1, "At least one universe should be registered"
+
+
+def test_universe_registry_is_read_only():
+    """The universe registry cannot be modified at runtime."""
+    with pytest.raises(TypeError):
+        UNIVERSES["starwars"] = UNIVERSES["startrek"]  # type: ignore[index]